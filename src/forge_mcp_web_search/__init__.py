@@ -1,5 +1,9 @@
 """Forge MCP Web Search - Web Search MCP server using Brave Search API."""
 
-from importlib.metadata import version
+from importlib.metadata import PackageNotFoundError, version
 
-__version__ = version("forge-mcp-web-search")
+# Resolved once at import; importlib.metadata walks the installed dists on every call
+try:
+    __version__ = version("forge-mcp-web-search")
+except PackageNotFoundError:  # running from a source tree that is not installed
+    __version__ = "0.0.0+unknown"
@@ -1,9 +1,13 @@
 """Brave Search API client."""
 
+import asyncio
 import os
-from typing import Literal
+import random
+from typing import Any, Literal, Self, cast
 
 import httpx
+import msgspec
+from cachetools import LRUCache
 
 from .models import (
     ImageResult,
@@ -16,43 +20,182 @@ from .models import (
     WebSearchResponse,
     WebSearchResult,
 )
+from .schema import (
+    ImageEnvelope,
+    ImageItem,
+    NewsEnvelope,
+    NewsItem,
+    QueryInfo,
+    SuggestEnvelope,
+    SuggestItem,
+    VideoEnvelope,
+    VideoItem,
+    WebEnvelope,
+    WebItem,
+)
+
+# Decoders are reusable and cheaper than calling msgspec.json.decode per response
+_WEB_DECODER = msgspec.json.Decoder(WebEnvelope)
+_NEWS_DECODER = msgspec.json.Decoder(NewsEnvelope)
+_IMAGE_DECODER = msgspec.json.Decoder(ImageEnvelope)
+_VIDEO_DECODER = msgspec.json.Decoder(VideoEnvelope)
+_SUGGEST_DECODER = msgspec.json.Decoder(SuggestEnvelope)
+
+# Rate limiting and transient upstream failures are retried with backoff
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 8.0
+
+# Error pages can be large HTML documents; only this much goes into the message
+_ERROR_BODY_LIMIT = 512
 
 
 class SearchError(Exception):
     """Base exception for search errors."""
 
-    pass
+    __slots__ = ()
 
 
 class APIKeyMissingError(SearchError):
     """API key is not configured."""
 
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(SearchError):
     """Rate limit exceeded."""
 
-    pass
+    __slots__ = ()
 
 
 class APIError(SearchError):
     """Error from Brave Search API."""
 
-    pass
+    __slots__ = ()
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """Return how long to wait before retrying, or None to give up.
+
+    A numeric Retry-After header is honored unless it exceeds the backoff
+    cap (e.g. a monthly quota reset), in which case waiting is pointless.
+    Otherwise use exponential backoff with jitter.
+    """
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            pass
+        else:
+            return delay if delay <= _RETRY_MAX_DELAY else None
+    return min(_RETRY_BASE_DELAY * 2**attempt + random.random() * 0.1, _RETRY_MAX_DELAY)
+
+
+async def _error_excerpt(response: httpx.Response) -> str:
+    """Read and decode at most _ERROR_BODY_LIMIT bytes of a streamed error body."""
+    excerpt = bytearray()
+    async for chunk in response.aiter_bytes():
+        excerpt += chunk
+        if len(excerpt) >= _ERROR_BODY_LIMIT:
+            break
+    return excerpt[:_ERROR_BODY_LIMIT].decode("utf-8", "replace")
+
+
+# Result parsers map decoded structs onto the public models. msgspec has
+# already type-checked the payload, so Pydantic validation is skipped.
+
+
+def _parse_web_results(items: list[WebItem]) -> list[WebSearchResult]:
+    """Map raw web results onto WebSearchResult models."""
+    return [
+        WebSearchResult.model_construct(
+            title=item.title,
+            url=item.url,
+            description=item.description,
+            age=item.age,
+            language=item.language,
+            family_friendly=item.family_friendly,
+        )
+        for item in items
+    ]
+
+
+def _parse_news_results(items: list[NewsItem]) -> list[NewsResult]:
+    """Map raw news results onto NewsResult models."""
+    # News thumbnails may be null; an absent src also means no thumbnail
+    return [
+        NewsResult.model_construct(
+            title=item.title,
+            url=item.url,
+            description=item.description,
+            source=item.meta_url.hostname,
+            published=item.age,
+            thumbnail=(item.thumbnail.src or None) if item.thumbnail else None,
+        )
+        for item in items
+    ]
+
+
+def _parse_image_results(items: list[ImageItem]) -> list[ImageResult]:
+    """Map raw image results onto ImageResult models."""
+    return [
+        ImageResult.model_construct(
+            title=item.title,
+            url=item.properties.url or item.url,
+            source_url=item.url,
+            thumbnail=item.thumbnail.src or "",
+            width=item.properties.width,
+            height=item.properties.height,
+            source=item.source,
+        )
+        for item in items
+    ]
+
+
+def _parse_video_results(items: list[VideoItem]) -> list[VideoResult]:
+    """Map raw video results onto VideoResult models."""
+    return [
+        VideoResult.model_construct(
+            title=item.title,
+            url=item.url,
+            description=item.description,
+            thumbnail=item.thumbnail.src or "",
+            duration=item.video.duration,
+            source=item.meta_url.hostname,
+            published=item.age,
+            views=item.video.views,
+        )
+        for item in items
+    ]
+
+
+def _parse_suggestions(items: list[SuggestItem | str]) -> list[str]:
+    """Flatten suggestions, which come back either as objects or as plain strings."""
+    return [item if isinstance(item, str) else item.query for item in items]
 
 
 class BraveSearchClient:
     """Async client for Brave Search API."""
 
     BASE_URL = "https://api.search.brave.com/res/v1"
+    ETAG_CACHE_SIZE = 256
 
-    def __init__(self, api_key: str | None = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         """Initialize the client.
 
         Args:
             api_key: Brave Search API key. If not provided, reads from BRAVE_API_KEY env var.
             timeout: Request timeout in seconds.
+            max_retries: Retries for rate-limited (429) or unavailable (502-504) responses.
+            transport: Transport to send requests through instead of the network,
+                e.g. an ``httpx.MockTransport`` in tests.
         """
         self.api_key = api_key or os.environ.get("BRAVE_API_KEY")
         if not self.api_key:
@@ -61,33 +204,114 @@ class BraveSearchClient:
                 "Get your API key at https://brave.com/search/api/"
             )
         self.timeout = timeout
+        self.max_retries = max_retries
+        self._http = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=timeout,
+            headers={
+                "X-Subscription-Token": self.api_key,
+                "Accept": "application/json",
+            },
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True,
+            transport=transport,
+        )
+        # (endpoint, params) -> (ETag, decoded response) for conditional requests
+        self._etag_cache: LRUCache[tuple, tuple[str, Any]] = LRUCache(maxsize=self.ETAG_CACHE_SIZE)
+        # (endpoint, params) -> request currently in flight, shared by identical calls
+        self._inflight: dict[tuple, asyncio.Task[Any]] = {}
+        # (endpoint, params) -> number of callers awaiting the in-flight request
+        self._waiters: dict[tuple, int] = {}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
 
-    async def _request(self, endpoint: str, params: dict) -> dict:
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.aclose()
+
+    async def _request[T](
+        self,
+        endpoint: str,
+        params: dict,
+        decoder: msgspec.json.Decoder[T],
+    ) -> T:
         """Make an authenticated request to Brave Search API.
 
+        Concurrent identical requests share a single HTTP call. Responses
+        that carry an ETag are cached, and repeating the same request sends
+        If-None-Match so a 304 reuses the decoded response. Rate-limited and
+        unavailable responses are retried with backoff.
+
         Args:
             endpoint: API endpoint (e.g., 'web/search')
             params: Query parameters
+            decoder: Decoder for the endpoint's response struct
 
         Returns:
-            JSON response as dict
+            Response body decoded into the decoder's struct type
 
         Raises:
-            RateLimitError: If rate limit exceeded (429)
+            RateLimitError: If rate limit exceeded (429) after all retries
             APIError: For other API errors
         """
-        headers = {
-            "X-Subscription-Token": self.api_key,
-            "Accept": "application/json",
-        }
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/{endpoint}",
-                params=params,
-                headers=headers,
-            )
-
+        key = (endpoint, tuple(sorted(params.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, endpoint, params, decoder))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            # Shield so one caller being cancelled does not cancel the others
+            return cast("T", await asyncio.shield(task))
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                # The last caller left, so nobody needs the request any more.
+                # Cancelling is a no-op if it already finished.
+                del self._waiters[key]
+                self._forget(key, task)
+                task.cancel()
+
+    def _forget(self, key: tuple, task: asyncio.Task[Any]) -> None:
+        """Stop sharing ``task`` for ``key`` and mark its outcome as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.done() and not task.cancelled():
+            task.exception()
+
+    async def _fetch[T](
+        self,
+        cache_key: tuple,
+        endpoint: str,
+        params: dict,
+        decoder: msgspec.json.Decoder[T],
+    ) -> T:
+        """Perform the HTTP request behind _request and decode the response."""
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        request = self._http.build_request("GET", endpoint, params=params, headers=headers)
+        # Stream the response so bodies we are going to discard (retries, 304s,
+        # rejected requests) are never read off the connection
+        response = await self._http.send(request, stream=True)
+        try:
+            attempt = 0
+            while response.status_code in _RETRY_STATUSES and attempt < self.max_retries:
+                delay = _retry_delay(response, attempt)
+                if delay is None:
+                    break
+                await response.aclose()
+                await asyncio.sleep(delay)
+                attempt += 1
+                response = await self._http.send(request, stream=True)
+
+            if response.status_code == 304 and cached:
+                return cast("T", cached[1])
             if response.status_code == 401:
                 raise APIError("Invalid API key")
             if response.status_code == 429:
@@ -96,9 +320,25 @@ class BraveSearchClient:
                     "Consider upgrading at https://brave.com/search/api/"
                 )
             if response.status_code != 200:
-                raise APIError(f"API request failed: {response.status_code} {response.text}")
-
-            return response.json()
+                excerpt = await _error_excerpt(response)
+                raise APIError(f"API request failed: {response.status_code} {excerpt}")
+
+            # Accumulate into one buffer that msgspec decodes in place
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+        finally:
+            await response.aclose()
+
+        try:
+            result = decoder.decode(body)
+        except msgspec.DecodeError as e:
+            raise APIError(f"Invalid API response: {e}") from e
+
+        etag = response.headers.get("etag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, result)
+        return result
 
     async def web_search(
         self,
@@ -123,40 +363,25 @@ class BraveSearchClient:
         Returns:
             WebSearchResponse with results
         """
-        params: dict = {
-            "q": query,
-            "count": min(max(count, 1), 20),
-            "safesearch": safe_search,
+        params = {
+            key: value
+            for key, value in (
+                ("q", query),
+                ("count", 1 if count < 1 else 20 if count > 20 else count),
+                ("safesearch", safe_search),
+                ("country", country),
+                ("search_lang", search_lang),
+                ("freshness", freshness),
+            )
+            if value
         }
 
-        if country:
-            params["country"] = country
-        if search_lang:
-            params["search_lang"] = search_lang
-        if freshness:
-            params["freshness"] = freshness
-
-        data = await self._request("web/search", params)
-
-        # Parse web results
-        results = []
-        web_data = data.get("web", {})
-        for item in web_data.get("results", []):
-            results.append(
-                WebSearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    description=item.get("description", ""),
-                    age=item.get("age"),
-                    language=item.get("language"),
-                    family_friendly=item.get("family_friendly", True),
-                )
-            )
+        data = await self._request("web/search", params, _WEB_DECODER)
 
-        return WebSearchResponse(
-            query=data.get("query", {}).get("original", query),
-            total_results=web_data.get("total"),
-            results=results,
+        return WebSearchResponse.model_construct(
+            query=data.query.original or query,
+            total_results=data.web.total,
+            results=_parse_web_results(data.web.results),
         )
 
     async def news_search(
@@ -181,41 +406,24 @@ class BraveSearchClient:
         Returns:
             NewsSearchResponse with news articles
         """
-        params: dict = {
-            "q": query,
-            "count": min(max(count, 1), 20),
-            "safesearch": safe_search,
+        params = {
+            key: value
+            for key, value in (
+                ("q", query),
+                ("count", 1 if count < 1 else 20 if count > 20 else count),
+                ("safesearch", safe_search),
+                ("country", country),
+                ("search_lang", search_lang),
+                ("freshness", freshness),
+            )
+            if value
         }
 
-        if country:
-            params["country"] = country
-        if search_lang:
-            params["search_lang"] = search_lang
-        if freshness:
-            params["freshness"] = freshness
-
-        data = await self._request("news/search", params)
-
-        results = []
-        for item in data.get("results", []):
-            thumbnail = None
-            if item.get("thumbnail"):
-                thumbnail = item["thumbnail"].get("src")
-
-            results.append(
-                NewsResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    description=item.get("description", ""),
-                    source=item.get("meta_url", {}).get("hostname", "Unknown"),
-                    published=item.get("age", ""),
-                    thumbnail=thumbnail,
-                )
-            )
+        data = await self._request("news/search", params, _NEWS_DECODER)
 
-        return NewsSearchResponse(
-            query=data.get("query", {}).get("original", query),
-            results=results,
+        return NewsSearchResponse.model_construct(
+            query=data.query.original or query,
+            results=_parse_news_results(data.results),
         )
 
     async def image_search(
@@ -236,37 +444,22 @@ class BraveSearchClient:
         Returns:
             ImageSearchResponse with image results
         """
-        params: dict = {
-            "q": query,
-            "count": min(max(count, 1), 20),
-            "safesearch": safe_search,
+        params = {
+            key: value
+            for key, value in (
+                ("q", query),
+                ("count", 1 if count < 1 else 20 if count > 20 else count),
+                ("safesearch", safe_search),
+                ("country", country),
+            )
+            if value
         }
 
-        if country:
-            params["country"] = country
-
-        data = await self._request("images/search", params)
-
-        results = []
-        for item in data.get("results", []):
-            properties = item.get("properties", {})
-            thumbnail = item.get("thumbnail", {})
-
-            results.append(
-                ImageResult(
-                    title=item.get("title", ""),
-                    url=properties.get("url", item.get("url", "")),
-                    source_url=item.get("url", ""),
-                    thumbnail=thumbnail.get("src", ""),
-                    width=properties.get("width", 0),
-                    height=properties.get("height", 0),
-                    source=item.get("source", ""),
-                )
-            )
+        data = await self._request("images/search", params, _IMAGE_DECODER)
 
-        return ImageSearchResponse(
-            query=data.get("query", {}).get("original", query),
-            results=results,
+        return ImageSearchResponse.model_construct(
+            query=data.query.original or query,
+            results=_parse_image_results(data.results),
         )
 
     async def video_search(
@@ -291,41 +484,24 @@ class BraveSearchClient:
         Returns:
             VideoSearchResponse with video results
         """
-        params: dict = {
-            "q": query,
-            "count": min(max(count, 1), 20),
-            "safesearch": safe_search,
+        params = {
+            key: value
+            for key, value in (
+                ("q", query),
+                ("count", 1 if count < 1 else 20 if count > 20 else count),
+                ("safesearch", safe_search),
+                ("country", country),
+                ("search_lang", search_lang),
+                ("freshness", freshness),
+            )
+            if value
         }
 
-        if country:
-            params["country"] = country
-        if search_lang:
-            params["search_lang"] = search_lang
-        if freshness:
-            params["freshness"] = freshness
-
-        data = await self._request("videos/search", params)
-
-        results = []
-        for item in data.get("results", []):
-            thumbnail = item.get("thumbnail", {})
-
-            results.append(
-                VideoResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    description=item.get("description", ""),
-                    thumbnail=thumbnail.get("src", ""),
-                    duration=item.get("video", {}).get("duration"),
-                    source=item.get("meta_url", {}).get("hostname", "Unknown"),
-                    published=item.get("age"),
-                    views=item.get("video", {}).get("views"),
-                )
-            )
+        data = await self._request("videos/search", params, _VIDEO_DECODER)
 
-        return VideoSearchResponse(
-            query=data.get("query", {}).get("original", query),
-            results=results,
+        return VideoSearchResponse.model_construct(
+            query=data.query.original or query,
+            results=_parse_video_results(data.results),
         )
 
     async def suggest(
@@ -344,32 +520,22 @@ class BraveSearchClient:
         Returns:
             SuggestResponse with suggested queries
         """
-        params: dict = {
-            "q": query,
-            "count": min(max(count, 1), 10),
+        params = {
+            key: value
+            for key, value in (
+                ("q", query),
+                ("count", 1 if count < 1 else 10 if count > 10 else count),
+                ("country", country),
+            )
+            if value
         }
 
-        if country:
-            params["country"] = country
-
-        data = await self._request("suggest/search", params)
+        data = await self._request("suggest/search", params, _SUGGEST_DECODER)
 
-        # Extract suggestions from response
-        suggestions = []
-        for item in data.get("results", []):
-            if isinstance(item, dict):
-                suggestions.append(item.get("query", ""))
-            elif isinstance(item, str):
-                suggestions.append(item)
-
-        # Extract original query from response
-        query_data = data.get("query", {})
-        if isinstance(query_data, dict):
-            original_query = query_data.get("original", query)
-        else:
-            original_query = query
+        # The echoed query is only structured when it is an object
+        echoed = data.query.original if isinstance(data.query, QueryInfo) else None
 
-        return SuggestResponse(
-            query=original_query,
-            suggestions=suggestions,
+        return SuggestResponse.model_construct(
+            query=echoed or query,
+            suggestions=_parse_suggestions(data.results),
         )
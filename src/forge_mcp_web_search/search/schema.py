@@ -0,0 +1,142 @@
+"""msgspec structs mirroring the raw Brave Search API JSON payloads.
+
+These are decoded straight from response bytes and then mapped onto the
+public Pydantic models in ``models.py``. Unknown keys are ignored.
+
+Defaults carry the fallback values the client exposes, and missing nested
+objects default to a shared frozen instance, so mapping a result is plain
+attribute access with no per-item allocation. Fields the API may send as
+``null`` stay optional, so one such value cannot fail the whole response;
+the client applies any fallback when mapping.
+"""
+
+import msgspec
+
+
+class QueryInfo(msgspec.Struct, frozen=True):
+    """The ``query`` object echoed back by every endpoint."""
+
+    original: str | None = None
+
+
+class Thumbnail(msgspec.Struct, frozen=True):
+    """Thumbnail attached to a news, image or video result."""
+
+    src: str | None = None
+
+
+class MetaUrl(msgspec.Struct, frozen=True):
+    """Parsed URL metadata for a result."""
+
+    hostname: str = "Unknown"
+
+
+class WebItem(msgspec.Struct, frozen=True):
+    """A raw web search result."""
+
+    title: str = ""
+    url: str = ""
+    description: str = ""
+    age: str | None = None
+    language: str | None = None
+    family_friendly: bool = True
+
+
+class WebSection(msgspec.Struct, frozen=True):
+    """The ``web`` section of a web search response."""
+
+    total: int | None = None
+    results: list[WebItem] = []
+
+
+class WebEnvelope(msgspec.Struct, frozen=True):
+    """Top-level web search response."""
+
+    query: QueryInfo = QueryInfo()
+    web: WebSection = WebSection()
+
+
+class NewsItem(msgspec.Struct, frozen=True):
+    """A raw news search result."""
+
+    title: str = ""
+    url: str = ""
+    description: str = ""
+    age: str = ""
+    meta_url: MetaUrl = MetaUrl()
+    thumbnail: Thumbnail | None = None
+
+
+class NewsEnvelope(msgspec.Struct, frozen=True):
+    """Top-level news search response."""
+
+    query: QueryInfo = QueryInfo()
+    results: list[NewsItem] = []
+
+
+class ImageProperties(msgspec.Struct, frozen=True):
+    """Full-size image properties of an image result."""
+
+    url: str | None = None
+    width: int = 0
+    height: int = 0
+
+
+class ImageItem(msgspec.Struct, frozen=True):
+    """A raw image search result."""
+
+    title: str = ""
+    url: str = ""
+    source: str | None = None
+    properties: ImageProperties = ImageProperties()
+    thumbnail: Thumbnail = Thumbnail()
+
+
+class ImageEnvelope(msgspec.Struct, frozen=True):
+    """Top-level image search response."""
+
+    query: QueryInfo = QueryInfo()
+    results: list[ImageItem] = []
+
+
+class VideoData(msgspec.Struct, frozen=True):
+    """Video-specific metadata of a video result."""
+
+    duration: str | None = None
+    views: str | None = None
+
+
+class VideoItem(msgspec.Struct, frozen=True):
+    """A raw video search result."""
+
+    title: str = ""
+    url: str = ""
+    description: str = ""
+    age: str | None = None
+    thumbnail: Thumbnail = Thumbnail()
+    video: VideoData = VideoData()
+    meta_url: MetaUrl = MetaUrl()
+
+
+class VideoEnvelope(msgspec.Struct, frozen=True):
+    """Top-level video search response."""
+
+    query: QueryInfo = QueryInfo()
+    results: list[VideoItem] = []
+
+
+class SuggestItem(msgspec.Struct, frozen=True):
+    """A single suggestion in object form."""
+
+    query: str = ""
+
+
+class SuggestEnvelope(msgspec.Struct, frozen=True):
+    """Top-level suggest response.
+
+    Some responses use plain strings instead of objects for both the
+    query and the suggestions.
+    """
+
+    query: QueryInfo | str = QueryInfo()
+    results: list[SuggestItem | str] = []
@@ -1,11 +1,15 @@
 """Web Search MCP Server using FastMCP and Brave Search API."""
 
-from importlib.metadata import version
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache
 from typing import Annotated, Literal
 
 from fastmcp import FastMCP
 from pydantic import Field
 
+from . import __version__
 from .search.client import BraveSearchClient
 from .search.models import (
     ImageSearchResponse,
@@ -15,8 +19,33 @@ from .search.models import (
     WebSearchResponse,
 )
 
-# Get package version
-__version__ = version("forge-mcp-web-search")
+
+@cache
+def get_client() -> BraveSearchClient:
+    """Get the shared client instance, creating it on first use.
+
+    Raises:
+        APIKeyMissingError: If BRAVE_API_KEY is not set.
+    """
+    return BraveSearchClient()
+
+
+# Create the client at import when the API key is already set, so tool calls
+# start on a ready connection pool
+if os.environ.get("BRAVE_API_KEY"):
+    get_client()
+
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared client's connection pool when the server shuts down."""
+    try:
+        yield
+    finally:
+        if get_client.cache_info().currsize:
+            await get_client().aclose()
+            get_client.cache_clear()
+
 
 # Create FastMCP server
 mcp = FastMCP(
@@ -42,19 +71,9 @@ Note: Requires BRAVE_API_KEY environment variable.
 Free tier: 2,000 queries/month, 1 query/sec.
 Get your API key at https://brave.com/search/api/
 """,
+    lifespan=_lifespan,
 )
 
-# Shared client instance (initialized lazily on first use)
-_client: BraveSearchClient | None = None
-
-
-def get_client() -> BraveSearchClient:
-    """Get or create the shared client instance."""
-    global _client  # noqa: PLW0603
-    if _client is None:
-        _client = BraveSearchClient()
-    return _client
-
 
 @mcp.tool
 async def web_search(
@@ -229,8 +248,11 @@ async def suggest(
 def main():
     """Run the web search MCP server."""
     import argparse
+    import importlib.util
     import logging
+    from functools import partial
 
+    import anyio
     import uvicorn
     from starlette.middleware import Middleware
     from starlette.middleware.cors import CORSMiddleware
@@ -244,8 +266,15 @@ def main():
     parser.add_argument("--host", default="0.0.0.0", help="Host for HTTP transport")
     args = parser.parse_args()
 
+    # uvloop is installed on Linux/macOS; run either transport on it when available
+    use_uvloop = importlib.util.find_spec("uvloop") is not None
+
     if args.stdio:
-        mcp.run(transport="stdio")
+        # Equivalent to mcp.run(transport="stdio"), which does not expose loop options
+        anyio.run(
+            partial(mcp.run_async, transport="stdio"),
+            backend_options={"use_uvloop": use_uvloop},
+        )
     else:
         from starlette.responses import JSONResponse
         from starlette.routing import Route
@@ -270,7 +299,12 @@ def main():
 
         print(f"Starting Web Search MCP Server on http://{args.host}:{args.port}/mcp")
         print("Note: BRAVE_API_KEY environment variable must be set")
-        uvicorn.run(app, host=args.host, port=args.port)
+        uvicorn.run(
+            app,
+            host=args.host,
+            port=args.port,
+            loop="uvloop" if use_uvloop else "asyncio",
+        )
 
 
 if __name__ == "__main__":
@@ -1,101 +1,133 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from functools import partial
+
+import httpx
 import pytest
-import respx
-from httpx import Response
+
+from forge_mcp_web_search import server
+from forge_mcp_web_search.search.client import BraveSearchClient
 
 from .fixtures import (
-    EMPTY_WEB_SEARCH_RESPONSE,
-    IMAGE_SEARCH_RESPONSE,
-    NEWS_SEARCH_RESPONSE,
-    SUGGEST_RESPONSE,
-    VIDEO_SEARCH_RESPONSE,
-    WEB_SEARCH_RESPONSE,
+    IMAGE_SEARCH_BYTES,
+    JSON_HEADERS,
+    NEWS_SEARCH_BYTES,
+    SUGGEST_BYTES,
+    VIDEO_SEARCH_BYTES,
+    WEB_SEARCH_BYTES,
 )
 
+# Canned response body for each endpoint path
+_BODIES = {
+    "/res/v1/web/search": WEB_SEARCH_BYTES,
+    "/res/v1/news/search": NEWS_SEARCH_BYTES,
+    "/res/v1/images/search": IMAGE_SEARCH_BYTES,
+    "/res/v1/videos/search": VIDEO_SEARCH_BYTES,
+    "/res/v1/suggest/search": SUGGEST_BYTES,
+}
 
-@pytest.fixture(autouse=True)
-def _set_api_key(monkeypatch):
-    """Ensure API key is set for all tests."""
-    monkeypatch.setenv("BRAVE_API_KEY", "test-api-key")
 
+class MockBraveAPI:
+    """The Brave Search API, served in-process through an httpx.MockTransport.
 
-@pytest.fixture
-def _mock_web_search(respx_mock: respx.MockRouter):
-    """Mock successful web search response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/web/search",
-    ).mock(return_value=Response(200, json=WEB_SEARCH_RESPONSE))
-    return respx_mock
+    Every endpoint answers with its canned fixture body unless a test sets
+    ``handler``, which may be sync or async. Received requests are recorded in ``requests``.
+    """
 
+    def __init__(self) -> None:
+        self.transport = httpx.MockTransport(self._handle)
+        self.requests: list[httpx.Request] = []
+        self.handler: (
+            Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]] | None
+        ) = None
 
-@pytest.fixture
-def _mock_web_search_empty(respx_mock: respx.MockRouter):
-    """Mock empty web search response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/web/search",
-    ).mock(return_value=Response(200, json=EMPTY_WEB_SEARCH_RESPONSE))
-    return respx_mock
+    def respond(self, *responses: httpx.Response) -> None:
+        """Answer the next requests with ``responses``, one each, in order."""
+        queued = iter(responses)
+        self.handler = lambda _request: next(queued)
 
+    def reset(self) -> None:
+        """Forget recorded requests and go back to the canned responses."""
+        self.requests.clear()
+        self.handler = None
 
-@pytest.fixture
-def _mock_news_search(respx_mock: respx.MockRouter):
-    """Mock successful news search response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/news/search",
-    ).mock(return_value=Response(200, json=NEWS_SEARCH_RESPONSE))
-    return respx_mock
+    def _handle(self, request: httpx.Request) -> httpx.Response | Awaitable[httpx.Response]:
+        self.requests.append(request)
+        if self.handler is not None:
+            return self.handler(request)
+        return httpx.Response(200, content=_BODIES[request.url.path], headers=JSON_HEADERS)
 
 
-@pytest.fixture
-def _mock_image_search(respx_mock: respx.MockRouter):
-    """Mock successful image search response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/images/search",
-    ).mock(return_value=Response(200, json=IMAGE_SEARCH_RESPONSE))
-    return respx_mock
+@pytest.fixture(scope="session")
+def mock_api() -> MockBraveAPI:
+    """The mock API every test client sends its requests to."""
+    return MockBraveAPI()
 
 
-@pytest.fixture
-def _mock_video_search(respx_mock: respx.MockRouter):
-    """Mock successful video search response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/videos/search",
-    ).mock(return_value=Response(200, json=VIDEO_SEARCH_RESPONSE))
-    return respx_mock
+@pytest.fixture(autouse=True)
+def _reset_mock_api(mock_api: MockBraveAPI) -> Iterator[None]:
+    """Undo a test's response overrides and recorded requests."""
+    yield
+    mock_api.reset()
 
 
-@pytest.fixture
-def _mock_suggest(respx_mock: respx.MockRouter):
-    """Mock successful suggest response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/suggest/search",
-    ).mock(return_value=Response(200, json=SUGGEST_RESPONSE))
-    return respx_mock
+@pytest.fixture(scope="session", autouse=True)
+async def _server_uses_mock_api(mock_api: MockBraveAPI) -> AsyncIterator[None]:
+    """Build the MCP server's shared client on the mock API's transport."""
+    mp = pytest.MonkeyPatch()
+    mp.setattr(
+        server, "BraveSearchClient", partial(BraveSearchClient, transport=mock_api.transport)
+    )
+    server.get_client.cache_clear()
+    yield
+    if server.get_client.cache_info().currsize:
+        await server.get_client().aclose()
+    server.get_client.cache_clear()
+    mp.undo()
 
 
-@pytest.fixture
-def _mock_unauthorized(respx_mock: respx.MockRouter):
-    """Mock unauthorized (401) response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/web/search",
-    ).mock(return_value=Response(401, json={"error": "Invalid API key"}))
-    return respx_mock
+@pytest.fixture(scope="session", autouse=True)
+def _set_api_key() -> Iterator[None]:
+    """Ensure API key is set for the whole session."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("BRAVE_API_KEY", "test-api-key")
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def mcp_tools() -> frozenset[str]:
+    """Names of the tools registered on the MCP server."""
+    return frozenset(server.mcp._tool_manager._tools)
+
+
+@pytest.fixture(scope="session")
+async def shared_client(mock_api: MockBraveAPI) -> AsyncIterator[BraveSearchClient]:
+    """One client for the whole session, amortizing HTTP client setup.
+
+    Tests that depend on client state (ETag cache, in-flight requests)
+    should build their own client instead.
+    """
+    async with BraveSearchClient(api_key="test-key", transport=mock_api.transport) as client:
+        yield client
 
 
 @pytest.fixture
-def _mock_rate_limit(respx_mock: respx.MockRouter):
-    """Mock rate limit (429) response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/web/search",
-    ).mock(return_value=Response(429, json={"error": "Rate limit exceeded"}))
-    return respx_mock
+async def invalid_client(mock_api: MockBraveAPI) -> AsyncIterator[BraveSearchClient]:
+    """Client configured with a key the API rejects."""
+    async with BraveSearchClient(api_key="invalid-key", transport=mock_api.transport) as client:
+        yield client
 
 
 @pytest.fixture
-def _mock_server_error(respx_mock: respx.MockRouter):
-    """Mock server error (500) response."""
-    respx_mock.get(
-        "https://api.search.brave.com/res/v1/web/search",
-    ).mock(return_value=Response(500, text="Internal Server Error"))
-    return respx_mock
+def retry_sleeps(monkeypatch) -> list[float]:
+    """Skip retry backoff waits, recording the requested delays instead."""
+    delays: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+    return delays
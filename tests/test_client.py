@@ -1,7 +1,8 @@
 """Tests for BraveSearchClient."""
 
+import asyncio
+
 import pytest
-import respx
 from httpx import Response
 
 from forge_mcp_web_search.search.client import (
@@ -12,27 +13,25 @@ from forge_mcp_web_search.search.client import (
 )
 
 from .fixtures import (
-    IMAGE_SEARCH_RESPONSE,
-    NEWS_SEARCH_RESPONSE,
-    SUGGEST_RESPONSE,
-    VIDEO_SEARCH_RESPONSE,
-    WEB_SEARCH_RESPONSE,
+    JSON_HEADERS,
+    SUGGEST_STRING_FORMAT_BYTES,
+    WEB_SEARCH_BYTES,
 )
 
 
 class TestClientInitialization:
     """Tests for client initialization."""
 
-    def test_client_with_api_key(self):
+    async def test_client_with_api_key(self):
         """Test client accepts API key directly."""
-        client = BraveSearchClient(api_key="test-key")
-        assert client.api_key == "test-key"
+        async with BraveSearchClient(api_key="test-key") as client:
+            assert client.api_key == "test-key"
 
-    def test_client_from_env_var(self, monkeypatch):
+    async def test_client_from_env_var(self, monkeypatch):
         """Test client reads API key from environment."""
         monkeypatch.setenv("BRAVE_API_KEY", "env-key")
-        client = BraveSearchClient()
-        assert client.api_key == "env-key"
+        async with BraveSearchClient() as client:
+            assert client.api_key == "env-key"
 
     def test_client_missing_api_key(self, monkeypatch):
         """Test client raises error when API key is missing."""
@@ -40,34 +39,19 @@ class TestClientInitialization:
         with pytest.raises(APIKeyMissingError):
             BraveSearchClient()
 
+    async def test_client_context_manager_closes_pool(self):
+        """Test the shared HTTP connection pool is closed on exit."""
+        async with BraveSearchClient(api_key="test-key") as client:
+            assert not client._http.is_closed
+        assert client._http.is_closed
+
 
 class TestWebSearch:
     """Tests for web search."""
 
-    @respx.mock
-    async def test_web_search_basic(self):
-        """Test basic web search."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/web/search",
-        ).mock(return_value=Response(200, json=WEB_SEARCH_RESPONSE))
-
-        client = BraveSearchClient(api_key="test-key")
-        result = await client.web_search("Python tutorial")
-
-        assert result.query == "Python tutorial"
-        assert len(result.results) == 2
-        assert result.results[0].title == "Python Tutorial - W3Schools"
-        assert result.total_results == 1000000
-
-    @respx.mock
-    async def test_web_search_with_params(self):
+    async def test_web_search_with_params(self, shared_client):
         """Test web search with all parameters."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/web/search",
-        ).mock(return_value=Response(200, json=WEB_SEARCH_RESPONSE))
-
-        client = BraveSearchClient(api_key="test-key")
-        result = await client.web_search(
+        result = await shared_client.web_search(
             query="Python tutorial",
             count=5,
             country="us",
@@ -78,118 +62,230 @@ class TestWebSearch:
 
         assert result.query == "Python tutorial"
 
+    async def test_web_search_chunked_body(self, mock_api, shared_client):
+        """Test a response body streamed in several chunks is decoded whole."""
+        body = WEB_SEARCH_BYTES
 
-class TestNewsSearch:
-    """Tests for news search."""
+        async def chunks():
+            for start in range(0, len(body), 64):
+                yield body[start : start + 64]
 
-    @respx.mock
-    async def test_news_search_basic(self):
-        """Test basic news search."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/news/search",
-        ).mock(return_value=Response(200, json=NEWS_SEARCH_RESPONSE))
+        mock_api.respond(Response(200, content=chunks()))
 
-        client = BraveSearchClient(api_key="test-key")
-        result = await client.news_search("AI news")
+        result = await shared_client.web_search("Python tutorial")
 
-        assert result.query == "AI news"
         assert len(result.results) == 2
-        assert result.results[0].title == "OpenAI Announces New Model"
-        assert result.results[0].source == "techcrunch.com"
-        assert result.results[0].thumbnail == "https://example.com/thumb1.jpg"
-        assert result.results[1].thumbnail is None
-
+        assert result.total_results == 1000000
 
-class TestImageSearch:
-    """Tests for image search."""
+    async def test_web_search_sends_only_set_filters(self, mock_api, shared_client):
+        """Test optional filters are sent only when given."""
+        await shared_client.web_search("Python tutorial", country="de", freshness="pd")
 
-    @respx.mock
-    async def test_image_search_basic(self):
-        """Test basic image search."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/images/search",
-        ).mock(return_value=Response(200, json=IMAGE_SEARCH_RESPONSE))
+        params = mock_api.requests[0].url.params
+        assert params["country"] == "de"
+        assert params["freshness"] == "pd"
+        assert "search_lang" not in params
 
-        client = BraveSearchClient(api_key="test-key")
-        result = await client.image_search("sunset mountains")
+    async def test_web_search_clamps_count(self, mock_api, shared_client):
+        """Test out-of-range counts are clamped to the API's limits."""
+        await shared_client.web_search("Python tutorial", count=50)
+        await shared_client.web_search("Python tutorial", count=0)
 
-        assert result.query == "sunset mountains"
-        assert len(result.results) == 2
-        assert result.results[0].title == "Beautiful Sunset Over Mountains"
-        assert result.results[0].width == 1920
-        assert result.results[0].height == 1080
+        assert mock_api.requests[0].url.params["count"] == "20"
+        assert mock_api.requests[1].url.params["count"] == "1"
 
 
-class TestVideoSearch:
-    """Tests for video search."""
+class TestConditionalRequests:
+    """Tests for ETag-based response caching."""
 
-    @respx.mock
-    async def test_video_search_basic(self):
-        """Test basic video search."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/videos/search",
-        ).mock(return_value=Response(200, json=VIDEO_SEARCH_RESPONSE))
+    async def test_not_modified_reuses_cached_response(self, mock_api):
+        """Test a 304 reply is served from the cached response."""
+        mock_api.respond(
+            Response(200, content=WEB_SEARCH_BYTES, headers={**JSON_HEADERS, "ETag": '"v1"'}),
+            Response(304),
+        )
 
-        client = BraveSearchClient(api_key="test-key")
-        result = await client.video_search("Python tutorial")
+        async with BraveSearchClient(api_key="test-key", transport=mock_api.transport) as client:
+            first = await client.web_search("Python tutorial")
+            second = await client.web_search("Python tutorial")
+
+        assert "If-None-Match" not in mock_api.requests[0].headers
+        assert mock_api.requests[1].headers["If-None-Match"] == '"v1"'
+        assert second == first
+
+    async def test_response_without_etag_is_not_cached(self, mock_api):
+        """Test responses without an ETag are always fetched in full."""
+        async with BraveSearchClient(api_key="test-key", transport=mock_api.transport) as client:
+            await client.web_search("Python tutorial")
+            await client.web_search("Python tutorial")
+
+        assert "If-None-Match" not in mock_api.requests[1].headers
+
+
+class TestRequestCoalescing:
+    """Tests for sharing identical in-flight requests."""
+
+    async def test_concurrent_identical_requests_share_one_call(self, mock_api):
+        """Test concurrent identical searches issue a single HTTP request."""
+        async with BraveSearchClient(api_key="test-key", transport=mock_api.transport) as client:
+            first, second = await asyncio.gather(
+                client.web_search("Python tutorial"),
+                client.web_search("Python tutorial"),
+            )
+
+        assert len(mock_api.requests) == 1
+        assert first == second
+        assert client._inflight == {}
+
+    async def test_different_requests_are_not_shared(self, mock_api):
+        """Test searches with different parameters are sent separately."""
+        async with BraveSearchClient(api_key="test-key", transport=mock_api.transport) as client:
+            await asyncio.gather(
+                client.web_search("Python tutorial"),
+                client.web_search("Python tutorial", count=5),
+            )
+
+        assert len(mock_api.requests) == 2
+
+    async def test_cancelling_only_caller_cancels_request(self, mock_api, caplog):
+        """Test the shared request stops once its only caller is cancelled."""
+        started = asyncio.Event()
+
+        async def hang(_request):
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_api.handler = hang
+        async with BraveSearchClient(api_key="test-key", transport=mock_api.transport) as client:
+            search = asyncio.ensure_future(client.web_search("test"))
+            await started.wait()
+            (shared,) = client._inflight.values()
+
+            search.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await search
+            await asyncio.wait([shared], timeout=1)
+
+            assert shared.cancelled()
+            assert client._inflight == {}
+            assert client._waiters == {}
+        assert "never retrieved" not in caplog.text
+
+    async def test_cancelling_one_caller_keeps_request_for_others(self, mock_api):
+        """Test the shared request carries on while another caller waits."""
+        release = asyncio.Event()
+
+        async def delayed(_request):
+            await release.wait()
+            return Response(200, content=WEB_SEARCH_BYTES, headers=JSON_HEADERS)
+
+        mock_api.handler = delayed
+        async with BraveSearchClient(api_key="test-key", transport=mock_api.transport) as client:
+            first = asyncio.ensure_future(client.web_search("Python tutorial"))
+            second = asyncio.ensure_future(client.web_search("Python tutorial"))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            release.set()
+            result = await second
 
-        assert result.query == "Python tutorial"
         assert len(result.results) == 2
-        assert result.results[0].title == "Python Tutorial for Beginners"
-        assert result.results[0].duration == "3:45:00"
-        assert result.results[0].views == "10M views"
+        assert len(mock_api.requests) == 1
 
 
 class TestSuggest:
     """Tests for search suggestions."""
 
-    @respx.mock
-    async def test_suggest_basic(self):
-        """Test basic suggest."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/suggest/search",
-        ).mock(return_value=Response(200, json=SUGGEST_RESPONSE))
+    async def test_suggest_string_format(self, mock_api, shared_client):
+        """Test suggest with plain-string query and suggestions."""
+        mock_api.respond(Response(200, content=SUGGEST_STRING_FORMAT_BYTES, headers=JSON_HEADERS))
 
-        client = BraveSearchClient(api_key="test-key")
-        result = await client.suggest("how to")
+        result = await shared_client.suggest("how")
 
-        assert result.query == "how to"
-        assert len(result.suggestions) == 5
-        assert "how to learn python" in result.suggestions
+        assert result.query == "how"
+        assert result.suggestions == [
+            "how to learn python",
+            "how to cook pasta",
+            "how to lose weight",
+        ]
 
 
 class TestErrorHandling:
     """Tests for error handling."""
 
-    @respx.mock
-    async def test_unauthorized_error(self):
+    async def test_unauthorized_error(self, mock_api, invalid_client):
         """Test handling of 401 unauthorized."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/web/search",
-        ).mock(return_value=Response(401, json={"error": "Invalid API key"}))
+        mock_api.respond(Response(401, json={"error": "Invalid API key"}))
 
-        client = BraveSearchClient(api_key="invalid-key")
         with pytest.raises(APIError, match="Invalid API key"):
-            await client.web_search("test")
+            await invalid_client.web_search("test")
 
-    @respx.mock
-    async def test_rate_limit_error(self):
-        """Test handling of 429 rate limit."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/web/search",
-        ).mock(return_value=Response(429, json={"error": "Rate limit exceeded"}))
+    async def test_rate_limit_error(self, mock_api, shared_client, retry_sleeps):
+        """Test handling of 429 rate limit once retries are exhausted."""
+        mock_api.handler = lambda _request: Response(429, json={"error": "Rate limit exceeded"})
 
-        client = BraveSearchClient(api_key="test-key")
         with pytest.raises(RateLimitError):
-            await client.web_search("test")
+            await shared_client.web_search("test")
+
+        assert len(mock_api.requests) == 4
+        assert len(retry_sleeps) == 3
+        assert retry_sleeps == sorted(retry_sleeps)
+
+    async def test_retry_recovers_from_unavailable(self, mock_api, shared_client, retry_sleeps):
+        """Test a transient 503 is retried and the retry succeeds."""
+        mock_api.respond(
+            Response(503),
+            Response(200, content=WEB_SEARCH_BYTES, headers=JSON_HEADERS),
+        )
 
-    @respx.mock
-    async def test_server_error(self):
+        result = await shared_client.web_search("Python tutorial")
+
+        assert len(mock_api.requests) == 2
+        assert len(retry_sleeps) == 1
+        assert len(result.results) == 2
+
+    async def test_retry_honors_retry_after(self, mock_api, shared_client, retry_sleeps):
+        """Test the Retry-After header sets the wait before retrying."""
+        mock_api.respond(
+            Response(429, headers={"Retry-After": "2"}),
+            Response(200, content=WEB_SEARCH_BYTES, headers=JSON_HEADERS),
+        )
+
+        await shared_client.web_search("Python tutorial")
+
+        assert retry_sleeps == [2.0]
+
+    async def test_long_retry_after_is_not_awaited(self, mock_api, shared_client, retry_sleeps):
+        """Test a Retry-After beyond the backoff cap fails immediately."""
+        mock_api.respond(Response(429, headers={"Retry-After": "86400"}))
+
+        with pytest.raises(RateLimitError):
+            await shared_client.web_search("test")
+
+        assert len(mock_api.requests) == 1
+        assert retry_sleeps == []
+
+    async def test_server_error(self, mock_api, shared_client):
         """Test handling of 500 server error."""
-        respx.get(
-            "https://api.search.brave.com/res/v1/web/search",
-        ).mock(return_value=Response(500, text="Internal Server Error"))
+        mock_api.respond(Response(500, text="Internal Server Error"))
 
-        client = BraveSearchClient(api_key="test-key")
         with pytest.raises(APIError, match="500"):
-            await client.web_search("test")
+            await shared_client.web_search("test")
+
+    async def test_server_error_body_is_truncated(self, mock_api, shared_client):
+        """Test only the start of a large error page is included."""
+        mock_api.respond(Response(500, text="x" * 100_000))
+
+        with pytest.raises(APIError) as exc_info:
+            await shared_client.web_search("test")
+
+        assert str(exc_info.value) == f"API request failed: 500 {'x' * 512}"
+
+    async def test_invalid_response_body(self, mock_api, shared_client):
+        """Test handling of a malformed JSON body."""
+        mock_api.respond(Response(200, text="<html>not json</html>"))
+
+        with pytest.raises(APIError, match="Invalid API response"):
+            await shared_client.web_search("test")
@@ -0,0 +1,160 @@
+"""Tests for each search endpoint, through the client and the MCP server."""
+
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import pytest
+from httpx import Response
+
+from forge_mcp_web_search.search.client import BraveSearchClient
+from forge_mcp_web_search.server import get_client
+
+from .fixtures import EMPTY_WEB_SEARCH_BYTES, JSON_HEADERS
+
+
+class SearchCase(NamedTuple):
+    """A search method, the query sent, and the fields to check in its result.
+
+    ``body`` replaces the endpoint's canned response when given.
+    """
+
+    name: str
+    method: str
+    query: str
+    fields: Callable[[Any], tuple[Any, ...]]
+    expected: tuple[Any, ...]
+    body: bytes | None = None
+
+
+SEARCH_CASES = [
+    SearchCase(
+        "web",
+        "web_search",
+        "Python tutorial",
+        lambda r: (r.query, len(r.results), r.results[0].title, r.total_results),
+        ("Python tutorial", 2, "Python Tutorial - W3Schools", 1000000),
+    ),
+    SearchCase(
+        "news",
+        "news_search",
+        "AI news",
+        lambda r: (
+            r.query,
+            len(r.results),
+            r.results[0].title,
+            r.results[0].source,
+            r.results[0].thumbnail,
+            r.results[1].thumbnail,
+        ),
+        (
+            "AI news",
+            2,
+            "OpenAI Announces New Model",
+            "techcrunch.com",
+            "https://example.com/thumb1.jpg",
+            None,
+        ),
+    ),
+    SearchCase(
+        "images",
+        "image_search",
+        "sunset mountains",
+        lambda r: (
+            r.query,
+            len(r.results),
+            r.results[0].title,
+            r.results[0].width,
+            r.results[0].height,
+        ),
+        ("sunset mountains", 2, "Beautiful Sunset Over Mountains", 1920, 1080),
+    ),
+    SearchCase(
+        "videos",
+        "video_search",
+        "Python tutorial",
+        lambda r: (
+            r.query,
+            len(r.results),
+            r.results[0].title,
+            r.results[0].duration,
+            r.results[0].views,
+        ),
+        ("Python tutorial", 2, "Python Tutorial for Beginners", "3:45:00", "10M views"),
+    ),
+    SearchCase(
+        "suggest",
+        "suggest",
+        "how to",
+        lambda r: (r.query, len(r.suggestions), r.suggestions[0]),
+        ("how to", 5, "how to learn python"),
+    ),
+    SearchCase(
+        "web_empty",
+        "web_search",
+        "xyznonexistentquery123",
+        lambda r: (r.query, r.results, r.total_results),
+        ("xyznonexistentquery123", [], 0),
+        EMPTY_WEB_SEARCH_BYTES,
+    ),
+    SearchCase(
+        "images_null_source",
+        "image_search",
+        "sunset",
+        lambda r: (r.results[0].title, r.results[0].source),
+        ("Sunset", None),
+        b'{"results": [{"title": "Sunset", "source": null}]}',
+    ),
+    SearchCase(
+        "news_null_thumbnail_src",
+        "news_search",
+        "AI news",
+        lambda r: (r.results[0].title, r.results[0].thumbnail),
+        ("Story", None),
+        b'{"results": [{"title": "Story", "thumbnail": {"src": null}}]}',
+    ),
+    SearchCase(
+        "images_null_thumbnail_src",
+        "image_search",
+        "sunset",
+        lambda r: (r.results[0].title, r.results[0].thumbnail),
+        ("Sunset", ""),
+        b'{"results": [{"title": "Sunset", "thumbnail": {"src": null}}]}',
+    ),
+    SearchCase(
+        "videos_null_thumbnail_src",
+        "video_search",
+        "Python tutorial",
+        lambda r: (r.results[0].title, r.results[0].thumbnail),
+        ("Intro", ""),
+        b'{"results": [{"title": "Intro", "thumbnail": {"src": null}}]}',
+    ),
+    # Missing ``query`` and ``web`` objects fall back to the struct defaults
+    SearchCase(
+        "web_no_sections",
+        "web_search",
+        "Python tutorial",
+        lambda r: (r.query, r.results, r.total_results),
+        ("Python tutorial", [], None),
+        b"{}",
+    ),
+]
+
+
+@pytest.fixture(params=["direct", "server"])
+def client(request, shared_client) -> BraveSearchClient:
+    """A client built directly, or the MCP server's shared one."""
+    return shared_client if request.param == "direct" else get_client()
+
+
+class TestSearch:
+    """Tests for each search endpoint's basic result mapping."""
+
+    @pytest.mark.parametrize("case", SEARCH_CASES, ids=lambda case: case.name)
+    async def test_search(self, client, mock_api, case):
+        """Test the method returns the mocked results for its endpoint."""
+        if case.body is not None:
+            mock_api.respond(Response(200, content=case.body, headers=JSON_HEADERS))
+
+        result = await getattr(client, case.method)(case.query)
+
+        assert case.fields(result) == case.expected